@@ -4,17 +4,26 @@ import torch
 import torch_geometric.transforms as T
 
 from greatx.datasets import GraphDataset
-from greatx.functional import drop_node
+from greatx.nn.layers import DropNode
 from greatx.nn.models import GCN
 from greatx.training import Trainer
 from greatx.training.callbacks import ModelCheckpoint
 from greatx.utils import split_nodes
 
 
-def drop_hook(self, inputs):
-    x, edge_index, edge_weight = inputs
-    return (x,
-            *drop_node(edge_index, edge_weight, p=0.2, training=self.training))
+class DropNodeWrapper(torch.nn.Module):
+    """Apply DropNode to the input graph before the wrapped model."""
+    def __init__(self, model, p=0.2):
+        super().__init__()
+        self.model = model
+        self.drop = DropNode(p)
+
+    def reset_parameters(self):
+        self.model.reset_parameters()
+
+    def forward(self, x, edge_index, edge_weight=None):
+        edge_index, edge_weight = self.drop(edge_index, edge_weight)
+        return self.model(x, edge_index, edge_weight)
 
 
 dataset = 'Cora'
@@ -29,9 +38,7 @@ num_features = data.x.size(-1)
 num_classes = data.y.max().item() + 1
 
 device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
-model = GCN(num_features, num_classes)
-hook = model.register_forward_pre_hook(drop_hook)
-# hook.remove() # remove hook
+model = DropNodeWrapper(GCN(num_features, num_classes), p=0.2)
 trainer = Trainer(model, device=device)
 ckp = ModelCheckpoint('model.pth', monitor='val_acc')
 trainer.fit(data, mask=(splits.train_nodes, splits.val_nodes), callbacks=[ckp])
@@ -87,6 +87,10 @@ class Attacker(torch.nn.Module):
         self.num_feats = data.x.size(1)
         self.nodes_set = set(range(self.num_nodes))
 
+        # sorted hashes of the edges, used for batched membership tests
+        row, col = self.edge_index
+        self._edge_hash = (row * self.num_nodes + col).sort().values
+
         if seed is not None:
             seed_everything(seed)
 
@@ -211,6 +215,28 @@ class Attacker(torch.nn.Module):
         return to_dense_adj(data.edge_index, data.edge_weight,
                             self.num_nodes).to(self.device)
 
+    def _is_edge(self, edges: Tensor) -> Tensor:
+        """Check whether the edges exist in the original graph.
+
+        Parameters
+        ----------
+        edges : Tensor
+            the edges to be checked, with shape [2, M]
+
+        Returns
+        -------
+        Tensor
+            a boolean mask with shape [M], where :obj:`True`
+            denotes the edge exists.
+        """
+        edge_hash = self._edge_hash
+        if edge_hash.numel() == 0:
+            return edges.new_zeros(edges.size(1), dtype=torch.bool)
+        query = edges[0] * self.num_nodes + edges[1]
+        index = torch.searchsorted(edge_hash, query)
+        index.clamp_(max=edge_hash.numel() - 1)
+        return edge_hash[index] == query
+
     def _check_feature_matrix_binary(self):
         """Check if the feature matrix is binary.
 
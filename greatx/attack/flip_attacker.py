@@ -97,6 +97,62 @@ class FlipAttacker(Attacker):
         self.degree[u] += 1
         self.degree[v] += 1
 
+    def remove_edges(self, edges: Tensor, its: Optional[Tensor] = None):
+        """Remove a set of edges from the graph.
+        This is the batched version of :meth:`remove_edge`.
+
+        Parameters
+        ----------
+        edges : Tensor
+            The edges to be removed, with shape [2, M]
+        its : Optional[Tensor], optional
+             The iterations that indicate the order of
+             the edges being removed, by default None
+        """
+        if edges.size(1) == 0:
+            return
+
+        row, col = edges
+        its = its.tolist() if its is not None else [None] * edges.size(1)
+        self._removed_edges.update(
+            zip(zip(row.tolist(), col.tolist()), its))
+        nodes = edges.flatten().to(self.degree.device)
+        self.degree.index_add_(0, nodes, -self.degree.new_ones(nodes.size(0)))
+
+        if not self._allow_singleton:
+            # checked after the update so that nodes losing several
+            # edges within the same batch are also taken into account
+            num_singletons = int((self.degree[nodes.unique()] <= 0).sum())
+            if num_singletons > 0:
+                warnings.warn(
+                    "You are trying to remove edges that would result "
+                    f"in {num_singletons} singleton nodes. "
+                    "If the behavior is not intended, "
+                    "please make sure you have set "
+                    "`attacker.set_allow_singleton(False)` "
+                    "or check your algorithm.", UserWarning)
+
+    def add_edges(self, edges: Tensor, its: Optional[Tensor] = None):
+        """Add a set of edges to the graph.
+        This is the batched version of :meth:`add_edge`.
+
+        Parameters
+        ----------
+        edges : Tensor
+            The edges to be added, with shape [2, M]
+        its : Optional[Tensor], optional
+             The iterations that indicate the order of
+             the edges being added, by default None
+        """
+        if edges.size(1) == 0:
+            return
+
+        row, col = edges
+        its = its.tolist() if its is not None else [None] * edges.size(1)
+        self._added_edges.update(zip(zip(row.tolist(), col.tolist()), its))
+        nodes = edges.flatten().to(self.degree.device)
+        self.degree.index_add_(0, nodes, self.degree.new_ones(nodes.size(0)))
+
     def removed_edges(self) -> Optional[Tensor]:
         """Get all the edges to be removed.
         """
@@ -127,7 +127,7 @@ class AdvInjection(InjectionAttacker, Surrogate):
             if interconnection:
                 candidate_nodes.append(injected_node)
 
-        self._injected_feats = injected_feats.data
+        self.inject_feats(injected_feats.size(0), injected_feats.data)
         return self
 
     def compute_gradients(self, x, edge_index, edge_weight, injected_feats,
@@ -1,8 +1,6 @@
 from copy import copy
-from functools import lru_cache
 from typing import List, Optional, Union
 
-import numpy as np
 import torch
 from torch import Tensor
 from torch_geometric.data import Data
@@ -64,10 +62,14 @@ class InjectionAttacker(Attacker):
         self.feat_budgets = None
         self.num_edges_global = None
         self.num_edges_local = None
-        self._injected_nodes = []
-        self._injected_edges = []
-        self._injected_feats = []
-        self.data.cache_clear()
+        self._injected_nodes = self.edge_index.new_empty(0)
+        self._injected_edges = self.edge_index.new_empty(2, 0)
+        self._injected_feats = self.feat.new_empty(0, self.num_feats)
+        self._num_injected_nodes = 0
+        self._num_injected_edges = 0
+        self._num_injected_feats = 0
+        self._x_buffer = None
+        self._cached_data = None
 
         return self
 
@@ -134,13 +136,14 @@ class InjectionAttacker(Attacker):
             self.targets = torch.arange(self.num_nodes, device=self.device)
             self.target_labels = self.label
         else:
-            if isinstance(targets, torch.BoolTensor):
+            if isinstance(targets, Tensor) and targets.dtype == torch.bool:
                 # Boolean mask
-                targets = targets.nonzero().view(-1)
+                targets = targets.to(self.device).nonzero().view(-1)
             else:
                 # node indices
-                targets = torch.LongTensor(targets).view(-1)
-            self.targets = targets.to(self.device)
+                targets = torch.as_tensor(targets, dtype=torch.long,
+                                          device=self.device).view(-1)
+            self.targets = targets
 
         self.target_labels = self.label[self.targets]
 
@@ -149,12 +152,12 @@ class InjectionAttacker(Attacker):
                                "cannot be used simultaneously.")
 
         if num_edges_global is not None:
-            num_edges_local = num_edges_global // len(self.targets)
+            num_edges_local = num_edges_global // self.targets.numel()
             if num_edges_local == 0:
                 raise ValueError(
                     "Too few edges allowed "
                     f"(num_edges_global={num_edges_global}) "
-                    f"for injected nodes ({len(self.targets)}). "
+                    f"for injected nodes ({self.targets.numel()}). "
                     "Maybe use the argument `num_edges_local` instead.")
 
         if num_edges_local is None:
@@ -215,18 +218,9 @@ class InjectionAttacker(Attacker):
 
     def injected_nodes(self) -> Optional[Tensor]:
         """Get all the nodes to be injected."""
-        nodes = self._injected_nodes
-        if nodes is None or len(nodes) == 0:
+        if self._num_injected_nodes == 0:
             return None
-
-        if torch.is_tensor(nodes):
-            return nodes.to(self.device)
-
-        if isinstance(nodes, dict):
-            nodes = sorted(list(nodes.keys()))
-
-        return torch.tensor(np.asarray(nodes, dtype="int64"),
-                            device=self.device)
+        return self._injected_nodes[:self._num_injected_nodes]
 
     def added_nodes(self) -> Optional[Tensor]:
         """alias of method `added_nodes`"""
@@ -234,21 +228,9 @@ class InjectionAttacker(Attacker):
 
     def injected_edges(self) -> Optional[Tensor]:
         """Get all the edges to be injected."""
-        edges = self._injected_edges
-        if edges is None or len(edges) == 0:
+        if self._num_injected_edges == 0:
             return None
-
-        if isinstance(edges, list) and torch.is_tensor(edges[0]):
-            edges = torch.cat(edges, dim=1)
-
-        if torch.is_tensor(edges):
-            return edges.to(self.device)
-
-        if isinstance(edges, dict):
-            edges = list(edges.keys())
-
-        return torch.tensor(
-            np.asarray(edges, dtype="int64").T, device=self.device)
+        return self._injected_edges[:, :self._num_injected_edges]
 
     def added_edges(self) -> Optional[Tensor]:
         """alias of method `injected_edges`"""
@@ -263,21 +245,27 @@ class InjectionAttacker(Attacker):
 
     def injected_feats(self) -> Optional[Tensor]:
         """Get the features injected nodes."""
-        feats = self._injected_feats
-        if feats is None or len(feats) == 0:
+        if self._num_injected_feats == 0:
             return None
-        if isinstance(feats, list):
-            return torch.stack(feats, dim=0).float().to(self.device)
-        return feats.float().to(self.device)
+        return self._injected_feats[:self._num_injected_feats]
 
     def added_feats(self) -> Optional[Tensor]:
         """alias of method `added_edges`"""
         return self.injected_feats()
 
     # Injection Operation
-    def inject_node(self, node):
+    def inject_node(self, node: int):
+        """Inject a node to the graph.
 
-        self._injected_nodes.append(node)
+        Parameters
+        ----------
+        node : int
+            The newly injected node.
+        """
+        n = self._num_injected_nodes
+        self._injected_nodes = _grow(self._injected_nodes, n + 1)
+        self._injected_nodes[n] = node
+        self._num_injected_nodes = n + 1
 
     def inject_edge(self, u: int, v: int):
         """Inject an edge to the graph.
@@ -289,8 +277,11 @@ class InjectionAttacker(Attacker):
         v : int
             The destination node of the edge.
         """
-
-        self._injected_edges.append([u, v])
+        n = self._num_injected_edges
+        self._injected_edges = _grow(self._injected_edges, n + 1, dim=1)
+        self._injected_edges[0, n] = u
+        self._injected_edges[1, n] = v
+        self._num_injected_edges = n + 1
 
     def inject_edges(self, edges: Union[Tensor, List]):
         """Inject a set of edges to the graph.
@@ -298,9 +289,14 @@ class InjectionAttacker(Attacker):
         Parameters
         ----------
         edges : Union[Tensor, List]
-            The newly injected.
+            The newly injected edges with shape [2, M].
         """
-        self._injected_edges.append(edges)
+        edges = torch.as_tensor(edges, dtype=torch.long, device=self.device)
+        n = self._num_injected_edges
+        m = n + edges.size(1)
+        self._injected_edges = _grow(self._injected_edges, m, dim=1)
+        self._injected_edges[:, n:m] = edges
+        self._num_injected_edges = m
 
     def inject_feat(self, feat: Optional[Tensor] = None):
         """Generate  a feature vector to the graph for a newly
@@ -313,26 +309,66 @@ class InjectionAttacker(Attacker):
              by default None
         """
         if feat is None:
-            if self.feat_budgets is not None:
-                # For boolean features, we generate it
-                # randomly flip features along the feature dimension
-                feat = self.feat.new_zeros(1, self.num_feats)
-                idx = torch.randperm(self.num_feats)[:self.feat_budgets]
-                feat[:, idx] = 1.0
-            else:
-                # For continuos features, we generate it
-                # following uniform distribution
-                feat = self.feat.new_empty(
-                    self.num_feats).uniform_(*self.feat_limits)
+            feat = self._random_feats(1)
         else:
-            if self.feat_budgets is not None:
-                assert feat.bool().sum() <= self.feat_budgets
-            else:
-                assert feat.min() >= self.feat_limits[0]
-                assert feat.max() <= self.feat_limits[1]
-        self._injected_feats.append(feat)
+            self._check_feats(feat)
+        self._append_feats(feat.reshape(1, -1))
+
+    def inject_feats(self, num_nodes: int, feats: Optional[Tensor] = None):
+        """Generate feature vectors to the graph for a set of newly
+        injected nodes. This is the batched version of :meth:`inject_feat`.
+
+        Parameters
+        ----------
+        num_nodes : int
+            the number of newly injected nodes
+        feats : Optional[Tensor], optional
+            the injected features with shape [num_nodes, num_feats].
+            If None, they would be randomly generated, by default None
+        """
+        if feats is None:
+            feats = self._random_feats(num_nodes)
+        else:
+            assert feats.size(0) == num_nodes
+            self._check_feats(feats)
+        self._append_feats(feats)
+
+    def _append_feats(self, feats: Tensor):
+        """Write the features into the buffer of injected features."""
+        n = self._num_injected_feats
+        m = n + feats.size(0)
+        self._injected_feats = _grow(self._injected_feats, m, dim=0)
+        self._injected_feats[n:m] = feats
+        self._num_injected_feats = m
+
+    def _random_feats(self, num_nodes: int) -> Tensor:
+        """Randomly generate features for :obj:`num_nodes` nodes
+        in one shot."""
+        if self.feat_budgets is not None:
+            # For boolean features, we generate it
+            # randomly flip features along the feature dimension,
+            # i.e., the top-k of uniform noise for each node
+            feats = self.feat.new_zeros(num_nodes, self.num_feats)
+            idx = torch.rand(num_nodes, self.num_feats,
+                             device=feats.device).topk(self.feat_budgets,
+                                                       dim=1).indices
+            feats.scatter_(1, idx, 1.0)
+        else:
+            # For continuos features, we generate it
+            # following uniform distribution
+            feats = self.feat.new_empty(num_nodes, self.num_feats).uniform_(
+                *self.feat_limits)
+        return feats
+
+    def _check_feats(self, feats: Tensor):
+        """Check whether the injected features are within
+        the allowed budgets or limitations."""
+        if self.feat_budgets is not None:
+            assert feats.bool().sum(-1).max() <= self.feat_budgets
+        else:
+            assert feats.min() >= self.feat_limits[0]
+            assert feats.max() <= self.feat_limits[1]
 
-    @lru_cache(maxsize=1)
     def data(self, symmetric: bool = True) -> Data:
         """return the attacked graph
 
@@ -345,13 +381,56 @@ class InjectionAttacker(Attacker):
         -------
         Data
             the attacked graph represented as PyG-like data
+
+        Note
+        ----
+        The result is cached until more nodes, edges or features
+        are injected. To avoid copying the original node features
+        on each call, the features of the returned graph are a view of
+        a buffer owned by the attacker, please do not modify it in-place.
         """
+        key = (symmetric, self._num_injected_edges, self._num_injected_feats)
+        if self._cached_data is not None and self._cached_data[0] == key:
+            return self._cached_data[1]
+
         data = copy(self.ori_data)
-        # injected_nodes = self.injected_nodes()
         injected_edges = self.injected_edges()
         injected_feats = self.injected_feats()
-        data.x = torch.cat([data.x, injected_feats], dim=0)
-        data.edge_index = add_edges(data.edge_index, injected_edges,
-                                    symmetric=symmetric)
+        if injected_feats is not None:
+            data.x = self._perturbed_feats(injected_feats)
+        if injected_edges is not None:
+            data.edge_index = add_edges(data.edge_index, injected_edges,
+                                        symmetric=symmetric)
 
+        self._cached_data = (key, data)
         return data
+
+    def _perturbed_feats(self, injected_feats: Tensor) -> Tensor:
+        """Return the node features followed by the injected ones,
+        the original features are copied into the buffer only once."""
+        feat = self.feat
+        num_nodes = feat.size(0)
+        size = num_nodes + injected_feats.size(0)
+        buffer = self._x_buffer
+        if buffer is None or buffer.size(0) < size:
+            num_budgets = self.num_budgets or 0
+            buffer = feat.new_empty(max(size, num_nodes + num_budgets),
+                                    feat.size(1))
+            buffer[:num_nodes] = feat
+            self._x_buffer = buffer
+        buffer[num_nodes:size] = injected_feats
+        return buffer[:size]
+
+
+def _grow(buffer: Tensor, size: int, dim: int = 0) -> Tensor:
+    """Return a buffer that holds at least :obj:`size` entries
+    along :obj:`dim`, doubling its capacity when it is full.
+    The existing entries are kept."""
+    capacity = buffer.size(dim)
+    if size <= capacity:
+        return buffer
+    shape = list(buffer.size())
+    shape[dim] = max(size, 2 * capacity, 16)
+    out = buffer.new_empty(shape)
+    out.narrow(dim, 0, capacity).copy_(buffer)
+    return out
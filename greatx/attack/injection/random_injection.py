@@ -1,6 +1,6 @@
 from typing import Optional, Union
 
-import numpy as np
+import torch
 from torch import Tensor
 from tqdm.auto import tqdm
 
@@ -98,21 +98,33 @@ class RandomInjection(InjectionAttacker):
                        num_edges_local=num_edges_local,
                        feat_limits=feat_limits, feat_budgets=feat_budgets)
 
-        candidate_nodes = self.targets.tolist()
-
-        for injected_node in tqdm(
-                range(self.num_nodes, self.num_nodes + self.num_budgets),
-                desc="Injecting nodes...", disable=disable):
-            sampled = np.random.choice(candidate_nodes, self.num_edges_local,
-                                       replace=False)
+        targets = self.targets
+        num_targets = targets.numel()
+
+        # generate the features of all injected nodes in one shot
+        self.inject_feats(self.num_budgets)
+
+        for i, injected_node in enumerate(
+                tqdm(range(self.num_nodes, self.num_nodes + self.num_budgets),
+                     desc="Injecting nodes...", disable=disable)):
+            # candidates are the targets, followed by the previously
+            # injected nodes if `interconnection=True`
+            num_candidates = num_targets + i if interconnection \
+                else num_targets
+            if num_candidates < self.num_edges_local:
+                raise ValueError(
+                    f"Cannot sample {self.num_edges_local} edges for the "
+                    f"injected node {injected_node} from only "
+                    f"{num_candidates} candidate nodes.")
+            sampled = torch.randperm(num_candidates,
+                                     device=self.device)[:self.num_edges_local]
+            sampled = torch.where(sampled < num_targets,
+                                  targets[sampled.clamp(max=num_targets - 1)],
+                                  sampled - num_targets + self.num_nodes)
 
             self.inject_node(injected_node)
-            self.inject_feat()
-
-            for target in sampled:
-                self.inject_edge(injected_node, target)
-
-            if interconnection:
-                candidate_nodes.append(injected_node)
+            self.inject_edges(
+                torch.stack([torch.full_like(sampled, injected_node),
+                             sampled]))
 
         return self
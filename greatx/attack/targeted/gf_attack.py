@@ -136,26 +136,24 @@ class GFAttack(TargetedAttacker):
         score = self.structure_score(self.adjacency_matrix, self.x_mean,
                                      self.eig_vals, self.eig_vec,
                                      candidate_edges, K=self.K, T=self.T,
-                                     method="nosum")
+                                     method="nosum", disable=disable)
 
         topk = torch.topk(score, k=self.num_budgets).indices.cpu()
         edges = candidate_edges[topk].reshape(-1, 2)
-        edge_weights = self.adjacency_matrix[edges[:, 0], edges[:, 1]].A1
-
-        for it, edge_weight in tqdm(enumerate(edge_weights),
-                                    desc='Peturbing graph...',
-                                    disable=disable):
-            u, v = edges[it]
-            if edge_weight > 0:
-                self.remove_edge(u, v, it)
-            else:
-                self.add_edge(u, v, it)
+        edges = torch.as_tensor(edges, dtype=torch.long,
+                                device=self.device).t()
+        its = torch.arange(edges.size(1), device=self.device)
+        # existing edges are removed and the others are added
+        mask = self._is_edge(edges)
+        self.remove_edges(edges[:, mask], its[mask])
+        self.add_edges(edges[:, ~mask], its[~mask])
         return self
 
     @staticmethod
     def structure_score(A: sp.csr_matrix, x_mean: Tensor, eig_vals: Tensor,
                         eig_vec: Tensor, candidate_edges: np.ndarray, K: int,
-                        T: int, method: str = "nosum"):
+                        T: int, method: str = "nosum",
+                        disable: bool = False):
         """Calculate the score of potential edges as formulated in paper.
 
         Parameters
@@ -182,6 +180,8 @@ class GFAttack(TargetedAttacker):
             "sum" denotes Equation (12), where the loss is derived
             from Sampling-based Graph Embedding Methods,
             by default "nosum"
+        disable : bool, optional
+            whether the tqdm progbar is to disabled, by default False
 
         Returns
         -------
@@ -193,7 +193,8 @@ class GFAttack(TargetedAttacker):
 
         D_min = A.sum(1).A1.min() + 1  # `+1` for the added selfloop
         score = []
-        for (u, v) in candidate_edges:
+        for (u, v) in tqdm(candidate_edges, desc='Computing edge scores...',
+                           disable=disable):
             eig_vals_res = (1 - 2 * A[
                 (u, v)]) * (2 * eig_vec[u] * eig_vec[v] - eig_vals *
                             (eig_vec[u].square() + eig_vec[v].square()))
@@ -47,21 +47,16 @@ class PGD:
 
             with torch.no_grad():
                 perturbations.data.add_(lr * gradients)
-                if perturbations.clamp(0, 1).sum() <= self.num_budgets:
+                # fetch all the scalars required by the projection at once
+                used_budget, top, bot = torch.stack([
+                    perturbations.clamp(0, 1).sum(),
+                    perturbations.max(),
+                    (perturbations.min() - 1).clamp_min(0)
+                ]).tolist()
+                if used_budget <= self.num_budgets:
                     perturbations.clamp_(0, 1)
                 else:
-                    top = perturbations.max().item()
-                    bot = (perturbations.min() - 1).clamp_min(0).item()
-                    mu = (top + bot) / 2
-                    while (top - bot) / 2 > 1e-5:
-                        used_budget = (perturbations - mu).clamp(0, 1).sum()
-                        if used_budget == self.num_budgets:
-                            break
-                        elif used_budget > self.num_budgets:
-                            bot = mu
-                        else:
-                            top = mu
-                        mu = (top + bot) / 2
+                    mu = bisection(perturbations, self.num_budgets, top, bot)
                     perturbations.sub_(mu).clamp_(0, 1)
 
         best_loss = -np.inf
@@ -79,11 +74,12 @@ class PGD:
                     best_pert = sampled
 
         row, col = torch.where(best_pert > 0.)
-        for it, (u, v) in enumerate(zip(row.tolist(), col.tolist())):
-            if self.adj[u, v] > 0:
-                self.remove_edge(u, v, it)
-            else:
-                self.add_edge(u, v, it)
+        flipped_edges = torch.stack([row, col], dim=0)
+        its = torch.arange(flipped_edges.size(1), device=row.device)
+        # existing edges are removed and the others are added
+        mask = self.adj[row, col] > 0
+        self.remove_edges(flipped_edges[:, mask], its[mask])
+        self.add_edges(flipped_edges[:, ~mask], its[~mask])
 
         return self
 
@@ -301,14 +297,29 @@ def symmetric(x: Tensor) -> Tensor:
     return x + x.T
 
 
+def bisection(x: Tensor, num_budgets: int, top: float, bot: float,
+              eps: float = 1e-5) -> Tensor:
+    """Search the offset :obj:`mu` in :obj:`[bot, top]` such that
+    :obj:`(x - mu).clamp(0, 1).sum()` meets :obj:`num_budgets`.
+    The number of steps is determined in advance so that the search
+    runs on the device of :obj:`x` without any synchronization."""
+    steps = max(math.ceil(math.log2(max(top - bot, eps) / (2 * eps))), 0)
+    top = x.new_tensor(top)
+    bot = x.new_tensor(bot)
+    for _ in range(steps):
+        mu = (top + bot) / 2
+        exceeded = (x - mu).clamp(0, 1).sum() > num_budgets
+        bot = torch.where(exceeded, mu, bot)
+        top = torch.where(exceeded, top, mu)
+    return (top + bot) / 2
+
+
 def margin_loss(logit: Tensor, y_true: Tensor) -> Tensor:
-    all_nodes = torch.arange(y_true.size(0))
+    y_true = y_true.view(-1, 1)
     # Get the scores of the true classes.
-    scores_true = logit[all_nodes, y_true]
+    scores_true = logit.gather(1, y_true).squeeze(1)
     # Get the highest scores when not considering the true classes.
-    scores_mod = logit.clone()
-    scores_mod[all_nodes, y_true] = -np.inf
-    scores_pred_excl_true = scores_mod.amax(dim=-1)
+    scores_pred_excl_true = logit.scatter(1, y_true, -np.inf).amax(dim=-1)
     return -(scores_true - scores_pred_excl_true).tanh().mean()
 
 
@@ -64,9 +64,8 @@ def drop_edge(edge_index: Tensor, edge_weight: Optional[Tensor] = None,
         return edge_index, edge_weight
 
     num_edges = edge_index.size(1)
-    e_ids = torch.arange(num_edges, dtype=torch.long, device=edge_index.device)
-    mask = torch.full_like(e_ids, p, dtype=torch.float32)
-    mask = torch.bernoulli(mask).to(torch.bool)
+    mask = torch.empty(num_edges, device=edge_index.device).bernoulli_(p)
+    mask = mask.to(torch.bool)
     edge_index = edge_index[:, ~mask]
     if edge_weight is not None:
         edge_weight = edge_weight[~mask]
@@ -125,11 +124,9 @@ def drop_node(
         return edge_index, edge_weight
 
     num_nodes = maybe_num_nodes(edge_index, num_nodes)
-    nodes = torch.arange(num_nodes, dtype=torch.long, device=edge_index.device)
-    mask = torch.full_like(nodes, 1 - p, dtype=torch.float32)
-    mask = torch.bernoulli(mask).to(torch.bool)
-    subset = nodes[mask]
-    return subgraph(subset, edge_index, edge_weight)
+    mask = torch.empty(num_nodes, device=edge_index.device).bernoulli_(1 - p)
+    mask = mask.to(torch.bool)
+    return subgraph(mask, edge_index, edge_weight)
 
 
 def drop_path(edge_index: Tensor, edge_weight: Optional[Tensor] = None,
@@ -91,7 +91,9 @@ def spmm(x: Tensor, edge_index: Union[Tensor, SparseTensor],
     if isinstance(edge_index, Tensor) and (edge_index.is_sparse
                                            or edge_index.dtype == torch.float):
         assert reduce in ['sum', 'add']
-        return torch.sparse.mm(edge_index, x)
+        if edge_index.is_sparse:
+            return torch.sparse.mm(edge_index, x)
+        return torch.mm(edge_index, x)
 
     # Case 3: `torch.LongTensor` (Sparse)
     if reduce == 'median':
@@ -1,3 +1,4 @@
+import inspect
 from typing import Optional
 
 import torch.nn as nn
@@ -17,8 +18,8 @@ def get(act: Optional[str] = None, inplace: bool = False) -> nn.Module:
         returns :class:`nn.Identity()`
         that returns the input as output, by default None
     inplace : bool, optional
-        the inplace argument in activation functions
-        currently it is not work since not all the functions
+        the inplace argument in activation functions,
+        which is ignored by those functions that do not
         take this argument, by default False
 
     Example
@@ -27,14 +28,17 @@ def get(act: Optional[str] = None, inplace: bool = False) -> nn.Module:
     >>> activations.get('relu')
     ReLU()
 
+    >>> activations.get('relu', inplace=True)
+    ReLU(inplace=True)
+
     >>> activations.get(None)
     Identity()
 
     NOTE
     ----
-    We currently do not support :obj:`inplace=True` since
-    not all activation functions in PyTorch support argument
-    :obj:`inplace=True`.
+    Not all activation functions in PyTorch support argument
+    :obj:`inplace=True`, e.g., :class:`GELU` and :class:`Tanh`,
+    for which :obj:`inplace` has no effect.
 
     Returns
     -------
@@ -54,7 +58,10 @@ def get(act: Optional[str] = None, inplace: bool = False) -> nn.Module:
 
     out = act_dict.get(act, None)
     if out:
-        return getattr(nn, out)()
+        act_class = getattr(nn, out)
+        if inplace and 'inplace' in inspect.signature(act_class).parameters:
+            return act_class(inplace=True)
+        return act_class()
     else:
         raise ValueError(
             f"Unknown activation {act}. The allowed activation functions"
@@ -63,11 +63,14 @@ class Sequential(nn.Sequential):
     def __init__(self, *args, loc: int = 0):
         super().__init__(*args)
         self.loc = loc
-        para_required = []
+        single_input = []
         for module in self:
             assert hasattr(module, "forward"), module
-            para_required.append(inspect.signature(module.forward).parameters)
-        self._para_required = para_required
+            para_required = inspect.signature(module.forward).parameters
+            single_input.append(len(para_required) == 1)
+        # whether each module takes only the feature input,
+        # resolved once here rather than on every forward pass
+        self._single_input = tuple(single_input)
 
     def forward(self, *inputs, **kwargs):
         """"""
@@ -75,8 +78,8 @@ class Sequential(nn.Sequential):
         assert loc <= len(inputs)
         output = inputs[loc]
 
-        for module, para_required in zip(self, self._para_required):
-            if len(para_required) == 1:
+        for module, single_input in zip(self, self._single_input):
+            if single_input:
                 input = inputs[loc]
                 if isinstance(input, tuple):
                     output = tuple(module(_input) for _input in input)
@@ -9,26 +9,31 @@ from torch_geometric.typing import Adj, OptTensor
 from torch_geometric.utils import add_self_loops
 from torch_sparse import SparseTensor, fill_diag
 
-from greatx.functional import spmm
+from greatx.functional import spmm, to_sparse_adj
 
 
 def dense_gcn_norm(adj: Tensor, improved: bool = False,
                    add_self_loops: bool = True, rate: float = -0.5) -> Tensor:
     fill_value = 2. if improved else 1.
-    if add_self_loops:
-        adj = dense_add_self_loops(adj, fill_value)
+    # NOTE: self-loops are added implicitly to the degrees and the diagonal
+    # of the output, which avoids materializing another N by N matrix
     deg = adj.sum(dim=1)
+    if add_self_loops:
+        deg = deg + fill_value
     deg_inv_sqrt = deg.pow_(rate)
     deg_inv_sqrt.masked_fill_(deg_inv_sqrt == float('inf'), 0.)
     norm_src = deg_inv_sqrt.view(1, -1)
     norm_dst = deg_inv_sqrt.view(-1, 1)
-    adj = norm_src * adj * norm_dst
-    return adj
+    out = adj * norm_src * norm_dst
+    if add_self_loops:
+        out.diagonal().add_(deg_inv_sqrt.pow(2) * fill_value)
+    return out
 
 
 def dense_add_self_loops(adj: Tensor, fill_value: float = 1.0) -> Tensor:
-    diag = torch.diag(adj.new_full((adj.size(0), ), fill_value))
-    return adj + diag
+    adj = adj.clone()
+    adj.diagonal().add_(fill_value)
+    return adj
 
 
 def make_self_loops(
@@ -150,7 +155,7 @@ class GCNConv(nn.Module):
         whether the layer computes
         :math:`\mathbf{\hat{A}}` as :math:`\mathbf{A} + 2\mathbf{I}`,
         by default False
-    cached : bool, optional (*UNUSED*)
+    cached : bool, optional
         whether the layer will cache
         the computation of :math:`\mathbf{\hat{D}}^{-1/2} \mathbf{\hat{A}}
         \mathbf{\hat{D}}^{-1/2}` on first execution, and will use the
@@ -162,6 +167,10 @@ class GCNConv(nn.Module):
         coefficients on the fly, by default True
     bias : bool, optional
         whether to use bias in the layers, by default True
+    amp : bool, optional
+        whether to run the linear projection under
+        :obj:`torch.bfloat16` autocast on CUDA devices,
+        which requires PyTorch>=1.10, by default False
 
     Note
     ----
@@ -170,25 +179,39 @@ class GCNConv(nn.Module):
     :obj:`torch.FloatTensor`, :obj:`torch.LongTensor`
     and obj:`torch_sparse.SparseTensor`.
 
-    In addition, the argument :obj:`cached` is unused. We add this argument
-    to be compatible with :class:`torch_geometric`.
+    If :obj:`amp=True`, only the linear projection runs in
+    :obj:`torch.bfloat16`, the normalization (i.e., the degree computation)
+    and the propagation are kept in the precision of the inputs for
+    numerical safety. Use :obj:`torch.backends.cuda.matmul.allow_tf32`
+    to further enable TF32 matrix multiplications globally.
+
+    If :obj:`cached=True`, the normalized graph is reused as long as the
+    same :obj:`edge_index` and :obj:`edge_weight` objects are passed in.
+    To accept a modified graph (e.g., during adversarial attacks),
+    please call :meth:`cache_clear` first to clear cached results.
 
     See also
     --------
     :class:`greatx.nn.models.supervised.GCN`
     """
+
+    _cached_edge: Optional[Tuple[Adj, OptTensor, Adj, OptTensor]]
+
     def __init__(self, in_channels: int, out_channels: int,
                  improved: bool = False, cached: bool = False,
                  add_self_loops: bool = True, normalize: bool = True,
-                 bias: bool = True):
+                 bias: bool = True, amp: bool = False):
         super().__init__()
 
         self.in_channels = in_channels
         self.out_channels = out_channels
         self.improved = improved
-        self.cached = cached  # NOTE: unused now
+        self.cached = cached
         self.add_self_loops = add_self_loops
         self.normalize = normalize
+        self.amp = amp
+
+        self._cached_edge = None
 
         self.lin = Linear(in_channels, out_channels, bias=False,
                           weight_initializer='glorot')
@@ -203,23 +226,57 @@ class GCNConv(nn.Module):
     def reset_parameters(self):
         self.lin.reset_parameters()
         zeros(self.bias)
+        self.cache_clear()
+
+    def cache_clear(self):
+        """Clear cached inputs or intermediate results."""
+        self._cached_edge = None
+        return self
 
     def forward(self, x: Tensor, edge_index: Adj,
                 edge_weight: OptTensor = None) -> Tensor:
         """"""
 
-        x = self.lin(x)
-
-        if self.add_self_loops:
-            edge_index, edge_weight = make_self_loops(edge_index, edge_weight,
-                                                      num_nodes=x.size(0),
-                                                      improved=self.improved)
+        if self.amp and x.is_cuda:
+            with torch.autocast('cuda', dtype=torch.bfloat16):
+                x = self.lin(x).to(x.dtype)
+        else:
+            x = self.lin(x)
 
-        if self.normalize:
-            edge_index, edge_weight = make_gcn_norm(edge_index, edge_weight,
-                                                    num_nodes=x.size(0),
-                                                    dtype=x.dtype,
-                                                    add_self_loops=False)
+        cache = self._cached_edge
+        if (cache is not None and cache[0] is edge_index
+                and cache[1] is edge_weight):
+            edge_index, edge_weight = cache[2], cache[3]
+        else:
+            inputs = (edge_index, edge_weight)
+            if self.add_self_loops:
+                edge_index, edge_weight = make_self_loops(
+                    edge_index, edge_weight, num_nodes=x.size(0),
+                    improved=self.improved)
+
+            if self.normalize:
+                edge_index, edge_weight = make_gcn_norm(
+                    edge_index, edge_weight, num_nodes=x.size(0),
+                    dtype=x.dtype, add_self_loops=False)
+
+            if self.cached:
+                if (isinstance(edge_index, Tensor)
+                        and edge_index.dtype == torch.long):
+                    # build the sparse matrix once so that further
+                    # executions go through sparse matrix multiplication,
+                    # it is transposed as `spmm` aggregates messages
+                    # from `edge_index[0]` to `edge_index[1]`
+                    edge_index = to_sparse_adj(edge_index.flip(0),
+                                               edge_weight, x.size(0))
+                    edge_weight = None
+                self._cached_edge = (*inputs, edge_index, edge_weight)
+
+        if (self.bias is not None and isinstance(edge_index, Tensor)
+                and not edge_index.is_sparse
+                and edge_index.dtype == torch.float):
+            # N by N dense adjacency matrix, where the bias addition
+            # is fused into the matrix multiplication
+            return torch.addmm(self.bias, edge_index, x)
 
         out = spmm(x, edge_index, edge_weight)
 
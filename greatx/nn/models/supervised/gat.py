@@ -1,12 +1,54 @@
-from typing import List
+import copy
+from typing import List, Optional, Tuple
 
+import torch
 import torch.nn as nn
+import torch.nn.functional as F
+from torch import Tensor
 from torch_geometric.nn import GATConv
+from torch_geometric.nn.dense.linear import Linear
+from torch_geometric.typing import Adj, OptTensor
+from torch_sparse import SparseTensor
 
 from greatx.nn.layers import Sequential, activations
 from greatx.utils import wrapper
 
 
+class ActDropout(nn.Module):
+    """Activation followed by dropout in a single module.
+
+    Parameters
+    ----------
+    act : Optional[str], optional
+        the activation function, by default None
+    dropout : float, optional
+        the dropout ratio, by default 0.
+    inplace : bool, optional
+        whether to apply the activation in-place, which overwrites
+        the input seen by forward hooks of the preceding layer,
+        by default False
+    """
+    def __init__(self, act: Optional[str] = None, dropout: float = 0.,
+                 inplace: bool = False):
+        super().__init__()
+        self.act = activations.get(act, inplace=inplace) \
+            if act is not None else None
+        self.p = dropout
+
+    def forward(self, x: Tensor) -> Tensor:
+        """"""
+        if self.act is not None:
+            x = self.act(x)
+        if self.p > 0:
+            # NOTE: not in-place since activations such as ReLU
+            # keep their outputs for backward
+            x = F.dropout(x, self.p, self.training)
+        return x
+
+    def extra_repr(self) -> str:
+        return f'p={self.p}'
+
+
 class GAT(nn.Module):
     r"""Graph Attention Networks (GAT) from the
     `"Graph Attention Networks"
@@ -31,7 +73,54 @@ class GAT(nn.Module):
     bn: bool, optional
         whether to use :class:`BatchNorm1d` after the convolution layer,
         by default False
+    inplace : bool, optional
+        whether to apply the activation functions in-place to reduce
+        peak memory, by default False
+    cached : bool, optional
+        whether the model will cache the preprocessed graph (with
+        self-loops) on first execution, and will use the cached version
+        for further executions, by default False
+    norm : str, optional
+        the normalization used if :obj:`bn=True`, :obj:`'bn'` for
+        :class:`BatchNorm1d` or :obj:`'ln'` for :class:`LayerNorm`,
+        whose statistics are computed within a single fused kernel,
+        by default 'bn'
+    compile : bool, optional
+        whether to compile the layers with :obj:`torch.compile`,
+        which requires PyTorch>=2.0, by default False
+    compile_mode : Optional[str], optional
+        the compilation mode passed to :obj:`torch.compile`,
+        e.g., :obj:`'reduce-overhead'` or :obj:`'max-autotune'`,
+        by default None
+    amp : bool, optional
+        whether to run the model under :obj:`torch.bfloat16` autocast
+        on CUDA devices, which requires PyTorch>=1.10, by default False
+    dense : bool, optional
+        whether to compute the attention over a dense
+        :math:`N \times N` mask with batched matrix multiplications
+        instead of message passing, which is only suitable for
+        small graphs, by default False
+
+    Note
+    ----
+    The input :obj:`edge_index` is converted into a transposed
+    :class:`torch_sparse.SparseTensor` with self-loops once per forward
+    pass, which is shared by all layers. The argument :obj:`edge_weight` is
+    ignored as the attention coefficients are computed internally.
+
+    If :obj:`inplace=True`, the outputs of the convolution and
+    normalization layers are overwritten by the activations, hence
+    forward hooks on these layers (e.g., :class:`greatx.utils.CKA`)
+    would observe post-activation values.
 
+    If :obj:`cached=True`, the preprocessed graph is reused as long as the
+    same :obj:`edge_index` object is passed in. To accept a modified graph
+    (e.g., during adversarial attacks), please call :meth:`cache_clear`
+    first to clear cached results.
+
+    If :obj:`amp=True`, the linear projections run in :obj:`torch.bfloat16`
+    while the outputs are cast back to the precision of the inputs.
+    No gradient scaling is required for :obj:`torch.bfloat16`.
 
     Examples
     --------
@@ -47,6 +136,9 @@ class GAT(nn.Module):
     >>> # GAT with deep architectures, each layer has elu activation
     >>> model = GAT(100, 10, hids=[16]*8, acts=['elu'])
 
+    >>> # GAT with dense attention for small graphs
+    >>> model = GAT(100, 10, dense=True)
+
     Reference:
 
     * Paper: https://arxiv.org/abs/1710.10903
@@ -54,34 +146,173 @@ class GAT(nn.Module):
     * Pytorch implementation: https://github.com/Diego999/pyGAT
 
     """
+
+    _cached_adj_t: Optional[Tuple[Adj, int, Adj]]
+    _compiled_conv: Optional[nn.Module]
+
     @wrapper
     def __init__(self, in_channels: int, out_channels: int,
                  hids: List[int] = [8], num_heads: List[int] = [8],
                  acts: List[str] = ['elu'], dropout: float = 0.6,
-                 bias: bool = True, bn: bool = False, includes=['num_heads']):
+                 bias: bool = True, bn: bool = False, inplace: bool = False,
+                 cached: bool = False, norm: str = 'bn', compile: bool = False,
+                 compile_mode: Optional[str] = None, amp: bool = False,
+                 dense: bool = False, includes=['num_heads']):
         super().__init__()
+        if norm not in ('bn', 'ln'):
+            raise ValueError(f"Unknown normalization {norm}. The allowed "
+                             "normalizations are ('bn', 'ln').")
+        self.cached = cached
+        self.amp = amp
+        self.dense = dense
+        self._cached_adj_t = None
         head = 1
         conv = []
         for hid, num_head, act in zip(hids, num_heads, acts):
             conv.append(
                 GATConv(in_channels * head, hid, heads=num_head, bias=bias,
-                        dropout=dropout))
+                        dropout=dropout, add_self_loops=False))
             if bn:
-                conv.append(nn.BatchNorm1d(hid * num_head))
-            conv.append(activations.get(act))
-            conv.append(nn.Dropout(dropout))
+                norm_layer = nn.BatchNorm1d if norm == 'bn' else nn.LayerNorm
+                conv.append(norm_layer(hid * num_head))
+            if act is not None or dropout > 0:
+                conv.append(ActDropout(act, dropout, inplace=inplace))
             in_channels = hid
             head = num_head
 
         conv.append(
             GATConv(in_channels * head, out_channels, heads=1, bias=bias,
-                    concat=False, dropout=dropout))
+                    concat=False, dropout=dropout, add_self_loops=False))
 
         self.conv = Sequential(*conv)
+        compiled_conv = None
+        if compile:
+            # `dynamic=True` avoids recompilations for graphs
+            # with varying numbers of nodes and edges
+            compiled_conv = torch.compile(self.conv, dynamic=True,
+                                          mode=compile_mode)
+        # not registered as a submodule, so that the parameter names
+        # (i.e., `state_dict` keys) are the same with or without compiling
+        object.__setattr__(self, '_compiled_conv', compiled_conv)
 
     def reset_parameters(self):
         self.conv.reset_parameters()
+        self.cache_clear()
+
+    def cache_clear(self):
+        """Clear cached inputs or intermediate results."""
+        self._cached_adj_t = None
+        return self
+
+    @torch.no_grad()
+    def quantize_for_inference(self) -> "GAT":
+        """Return a copy of the model whose linear projections are
+        dynamically quantized to :obj:`torch.qint8` weights.
+
+        Returns
+        -------
+        GAT
+            the quantized model in evaluation mode
 
-    def forward(self, x, edge_index, edge_weight=None):
+        Note
+        ----
+        The quantized model is for inference on CPU only,
+        please call it after training.
+        """
+        # the compiled module is not copied, i.e., set as None
+        memo = {id(self._compiled_conv): None}
+        model = copy.deepcopy(self, memo).cache_clear().eval()
+        # PyG's :class:`Linear` is not recognized by `quantize_dynamic`,
+        # convert it into :class:`torch.nn.Linear` first
+        converted = {}
+        for module in list(model.modules()):
+            for name, child in list(module.named_children()):
+                if not isinstance(child, Linear):
+                    continue
+                if child not in converted:
+                    lin = nn.Linear(child.in_channels, child.out_channels,
+                                    bias=child.bias is not None)
+                    lin.weight.copy_(child.weight)
+                    if child.bias is not None:
+                        lin.bias.copy_(child.bias)
+                    converted[child] = lin
+                setattr(module, name, converted[child])
+        return torch.quantization.quantize_dynamic(model, {nn.Linear},
+                                                   dtype=torch.qint8)
+
+    def forward(self, x: Tensor, edge_index: Adj,
+                edge_weight: OptTensor = None) -> Tensor:
         """"""
-        return self.conv(x, edge_index, edge_weight)
+        # sliced features (e.g., from samplers) would otherwise be
+        # copied implicitly inside the first linear projection
+        x = x.contiguous()
+        num_nodes = x.size(0)
+        cache = self._cached_adj_t
+        if (self.cached and cache is not None and cache[0] is edge_index
+                and cache[1] == num_nodes):
+            adj_t = cache[2]
+        else:
+            if isinstance(edge_index, SparseTensor):
+                adj_t = edge_index
+            else:
+                # messages are aggregated from `edge_index[0]`
+                # to `edge_index[1]`, hence the transposed matrix
+                adj_t = SparseTensor(row=edge_index[1], col=edge_index[0],
+                                     sparse_sizes=(num_nodes, num_nodes))
+            # self-loops are added once here rather than in every layer
+            adj_t = adj_t.set_diag()
+            if self.dense:
+                row, col, _ = adj_t.coo()
+                mask = torch.zeros(num_nodes, num_nodes, dtype=torch.bool,
+                                   device=row.device)
+                mask[row, col] = True
+                adj_t = mask
+            if self.cached:
+                self._cached_adj_t = (edge_index, num_nodes, adj_t)
+
+        if self.amp and x.is_cuda:
+            with torch.autocast('cuda', dtype=torch.bfloat16):
+                return self._propagate(x, adj_t).to(x.dtype)
+
+        return self._propagate(x, adj_t)
+
+    def _propagate(self, x: Tensor, adj_t: Adj) -> Tensor:
+        if not self.dense:
+            conv = self._compiled_conv
+            if conv is None:
+                conv = self.conv
+            return conv(x, adj_t)
+
+        # the compiled module (if any) is bypassed in the dense mode
+        for layer in self.conv:
+            if isinstance(layer, GATConv):
+                x = dense_gat_conv(layer, x, adj_t)
+            else:
+                x = layer(x)
+        return x
+
+
+def dense_gat_conv(conv: GATConv, x: Tensor, mask: Tensor) -> Tensor:
+    r"""Dense counterpart of :class:`GATConv` using its parameters, where
+    :obj:`mask` is a boolean :math:`N \times N` matrix whose entry
+    :obj:`(i, j)` denotes an edge from node :obj:`j` to node :obj:`i`."""
+    H, C = conv.heads, conv.out_channels
+    # `lin` in newer PyG versions, `lin_src` (shared with `lin_dst`) before
+    lin = getattr(conv, 'lin', None)
+    if lin is None:
+        lin = conv.lin_src
+    h = lin(x).view(-1, H, C)
+    alpha_src = (h * conv.att_src).sum(dim=-1).t()  # [H, N]
+    alpha_dst = (h * conv.att_dst).sum(dim=-1).t()  # [H, N]
+    alpha = alpha_dst.unsqueeze(-1) + alpha_src.unsqueeze(1)  # [H, N, N]
+    alpha = F.leaky_relu(alpha, conv.negative_slope)
+    alpha = alpha.masked_fill(~mask, float('-inf')).softmax(dim=-1)
+    alpha = F.dropout(alpha, p=conv.dropout, training=conv.training)
+    out = torch.bmm(alpha, h.transpose(0, 1)).transpose(0, 1)  # [N, H, C]
+    if conv.concat:
+        out = out.reshape(-1, H * C)
+    else:
+        out = out.mean(dim=1)
+    if conv.bias is not None:
+        out = out + conv.bias
+    return out
@@ -665,6 +665,12 @@ class ModelCheckpoint(Callback):
     """Callback to save the Keras model or model weights
     at some frequency.
 
+    Note
+    ----
+    If :obj:`autoload=True`, the checkpoints only serve to restore
+    the model at the end of training, so the latest weights are kept
+    as an in-memory copy on the model's device instead of being
+    written to :obj:`filepath`.
     """
     def __init__(self, filepath, monitor='val_loss', verbose=0,
                  save_best_only=True, save_weights_only=True, autoload=True,
@@ -679,6 +685,7 @@ class ModelCheckpoint(Callback):
         self._batches_seen_since_last_saving = 0
         self._last_batch_seen = 0
         self._filepaths = []
+        self._state_dict = None
 
         if autoload and not save_weights_only:
             logging.warning(
@@ -711,18 +718,15 @@ class ModelCheckpoint(Callback):
 
     def on_train_begin(self, logs=None):
         folder = os.path.split(self.filepath)[0]
-        if folder:
-            folder = folder
+        if folder and not self.autoload:
             if self.verbose > 0:
                 print(f"mkdir {folder}.")
             os.mkdir(folder)
 
     def on_train_end(self, logs=None):
-        if self.autoload and self._filepaths:
-            self.model.load_state_dict(torch.load(self._filepaths[-1]))
-            for filepath in self._filepaths:
-                if os.path.exists(filepath):
-                    os.remove(filepath)
+        if self.autoload and self._state_dict is not None:
+            self.model.load_state_dict(self._state_dict)
+            self._state_dict = None
 
     def on_train_batch_end(self, batch, logs=None):
         pass
@@ -745,6 +749,10 @@ class ModelCheckpoint(Callback):
         logs = logs or {}
 
         filepath = self._get_file_path(epoch, logs)
+        if self.autoload:
+            saving = 'keeping best weights in memory'
+        else:
+            saving = 'saving model to %s' % filepath
 
         try:
             if self.save_best_only:
@@ -757,15 +765,11 @@ class ModelCheckpoint(Callback):
                     if self.monitor_op(current, self.best):
                         if self.verbose > 0:
                             print('\nEpoch %05d: %s improved from %0.5f '
-                                  'to %0.5f, saving model to %s' %
+                                  'to %0.5f, %s' %
                                   (epoch + 1, self.monitor, self.best, current,
-                                   filepath))
+                                   saving))
                         self.best = current
-                        if self.save_weights_only:
-                            torch.save(self.model.state_dict(), filepath)
-                        else:
-                            torch.save(self.model, filepath)
-                        self._filepaths.append(filepath)
+                        self._save(filepath)
                     else:
                         if self.verbose > 0:
                             print(
@@ -773,13 +777,8 @@ class ModelCheckpoint(Callback):
                                 (epoch + 1, self.monitor, self.best))
             else:
                 if self.verbose > 0:
-                    print('\nEpoch %05d: saving model to %s' %
-                          (epoch + 1, filepath))
-                if self.save_weights_only:
-                    torch.save(self.model.state_dict(), filepath)
-                else:
-                    torch.save(self.model, filepath)
-                self._filepaths.append(filepath)
+                    print('\nEpoch %05d: %s' % (epoch + 1, saving))
+                self._save(filepath)
 
         except IOError as e:
             if 'is a directory' in str(e.args[0]).lower():
@@ -789,6 +788,22 @@ class ModelCheckpoint(Callback):
             # Re-throw the error for any other causes.
             raise e
 
+    def _save(self, filepath):
+        if self.autoload:
+            # keep the weights on device, which avoids
+            # the device-to-host copies and disk writes
+            self._state_dict = {
+                k: v.detach().clone()
+                for k, v in self.model.state_dict().items()
+            }
+            return
+
+        if self.save_weights_only:
+            torch.save(self.model.state_dict(), filepath)
+        else:
+            torch.save(self.model, filepath)
+        self._filepaths.append(filepath)
+
     def _get_file_path(self, epoch, logs):
         """Returns the file path for checkpoint."""
         try:
@@ -189,11 +189,11 @@ def wrapper(func: Callable) -> Callable:
 
     """
 
+    # inspect the signature once at decoration time
+    inspect_paras = list(inspect.signature(func).parameters.values())
+
     @functools.wraps(func)
     def decorate(*args, **kwargs) -> Any:
-        inspect_paras = inspect.signature(func).parameters
-        inspect_paras = list(inspect_paras.values())
-
         paras = {}
         unspecified = []
         i = 0
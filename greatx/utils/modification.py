@@ -1,14 +1,11 @@
 import copy
+from typing import Tuple
 
 import torch
 from torch import Tensor
 from torch_geometric.data import Data
 from torch_geometric.utils import coalesce as coalesce_edges
-from torch_geometric.utils import (
-    from_scipy_sparse_matrix,
-    sort_edge_index,
-    to_scipy_sparse_matrix,
-)
+from torch_geometric.utils import sort_edge_index
 
 
 def add_edges(edge_index: Tensor, edges_to_add: Tensor, symmetric: bool = True,
@@ -72,25 +69,15 @@ def remove_edges(edge_index: Tensor, edges_to_remove: Tensor,
     if edges_to_remove.size(1) == 0:
         return edge_index
 
-    device = edge_index.device
     if symmetric:
         edges_to_remove = torch.cat(
             [edges_to_remove, edges_to_remove.flip(0)], dim=1)
     edges_to_remove = edges_to_remove.to(edge_index)
 
-    num_nodes = max(edge_index.max().item(), edges_to_remove.max().item()) + 1
-    adj_matrix = to_scipy_sparse_matrix(edge_index,
-                                        num_nodes=num_nodes).tocsr(copy=False)
-
-    row, col = edges_to_remove.cpu().numpy()
-    adj_matrix = adj_matrix.tolil(copy=True)
-    adj_matrix[(row, col)] = 0
-    adj_matrix = adj_matrix.tocsr(copy=False)
-    adj_matrix.eliminate_zeros()
-
-    edge_index, _ = from_scipy_sparse_matrix(adj_matrix)
-    edge_index = sort_edge_index(edge_index)
-    return edge_index.to(device)
+    # existing edges are counted as +1 and removed edges as -1,
+    # only the edges remaining positive after coalescing are kept
+    edge_index, count = _signed_coalesce(edge_index, edges_to_remove, -1)
+    return edge_index[:, count > 0]
 
 
 def flip_edges(edge_index: Tensor, edges_to_flip: Tensor,
@@ -116,30 +103,16 @@ def flip_edges(edge_index: Tensor, edges_to_flip: Tensor,
     if edges_to_flip.size(1) == 0:
         return edge_index
 
-    device = edge_index.device
     if symmetric:
         edges_to_flip = torch.cat(
             [edges_to_flip, edges_to_flip.flip(0)], dim=1)
 
     edges_to_flip = edges_to_flip.to(edge_index)
 
-    num_nodes = max(edge_index.max().item(), edges_to_flip.max().item()) + 1
-    adj_matrix = to_scipy_sparse_matrix(edge_index,
-                                        num_nodes=num_nodes).tocsr(copy=False)
-
-    row, col = edges_to_flip.cpu().numpy()
-    data = adj_matrix[(row, col)].A
-    data[data > 0.] = 1.
-    data[data < 0.] = 0.
-
-    adj_matrix = adj_matrix.tolil(copy=True)
-    adj_matrix[(row, col)] = 1. - data
-    adj_matrix = adj_matrix.tocsr(copy=False)
-    adj_matrix.eliminate_zeros()
-
-    edge_index, _ = from_scipy_sparse_matrix(adj_matrix)
-    edge_index = sort_edge_index(edge_index)
-    return edge_index.to(device)
+    # both existing and flipped edges are counted as +1,
+    # an edge remains if and only if it appears exactly once
+    edge_index, count = _signed_coalesce(edge_index, edges_to_flip, 1)
+    return edge_index[:, count == 1]
 
 
 def flip_graph(data: Data, edges_to_flip: Tensor,
@@ -173,3 +146,17 @@ def flip_graph(data: Data, edges_to_flip: Tensor,
     data.edge_weight = None
     data.adj_t = None
     return data
+
+
+def _signed_coalesce(edge_index: Tensor, edges: Tensor,
+                     sign: int) -> Tuple[Tensor, Tensor]:
+    """Merge the (deduplicated) :obj:`edge_index` and :obj:`edges`
+    into a coalesced graph, where each edge in :obj:`edge_index` counts
+    as :obj:`1` and each edge in :obj:`edges` counts as :obj:`sign`."""
+    edge_index = coalesce_edges(edge_index)
+    edges = coalesce_edges(edges)
+    count = torch.cat([
+        edge_index.new_ones(edge_index.size(1)),
+        edges.new_full((edges.size(1), ), sign)
+    ])
+    return coalesce_edges(torch.cat([edge_index, edges], dim=1), count)